@@ -1,108 +1,267 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import requests
-import time
+import numpy as np
+import orjson
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from collections import namedtuple
 import os
-from dotenv import load_dotenv
 
 # Configuración inicial
-load_dotenv()
 st.set_page_config(layout="wide", page_title="📊 Análisis Económico FMI", page_icon="🌍")
 
+@st.cache_resource(show_spinner=False)
+def cargar_entorno():
+    # Solo en el primer arranque del proceso, no en cada rerun
+    from dotenv import load_dotenv
+    load_dotenv()
+
+cargar_entorno()
+
 # ======================================
 # 1. Configuración de Datos y API
 # ======================================
 
+# Metadatos como tuplas con nombre: acceso por atributo en vez de doble búsqueda en diccionarios
+Pais = namedtuple("Pais", "nombre iso2")
+Indicador = namedtuple("Indicador", "codigo unidad tipo")
+
 # Diccionario completo de países
 PAISES = {
-    "USA": {"nombre": "Estados Unidos", "iso2": "US"},
-    "MEX": {"nombre": "México", "iso2": "MX"},
-    "BRA": {"nombre": "Brasil", "iso2": "BR"},
-    "ESP": {"nombre": "España", "iso2": "ES"},
-    "ARG": {"nombre": "Argentina", "iso2": "AR"},
-    "COL": {"nombre": "Colombia", "iso2": "CO"},
-    "CHL": {"nombre": "Chile", "iso2": "CL"},
-    "PER": {"nombre": "Perú", "iso2": "PE"},
-    "DEU": {"nombre": "Alemania", "iso2": "DE"},
-    "FRA": {"nombre": "Francia", "iso2": "FR"},
-    "GBR": {"nombre": "Reino Unido", "iso2": "GB"},
-    "CHN": {"nombre": "China", "iso2": "CN"}
+    "USA": Pais("Estados Unidos", "US"),
+    "MEX": Pais("México", "MX"),
+    "BRA": Pais("Brasil", "BR"),
+    "ESP": Pais("España", "ES"),
+    "ARG": Pais("Argentina", "AR"),
+    "COL": Pais("Colombia", "CO"),
+    "CHL": Pais("Chile", "CL"),
+    "PER": Pais("Perú", "PE"),
+    "DEU": Pais("Alemania", "DE"),
+    "FRA": Pais("Francia", "FR"),
+    "GBR": Pais("Reino Unido", "GB"),
+    "CHN": Pais("China", "CN")
 }
 
+# Nombre a mostrar indexado por código ISO2 (las respuestas del FMI vienen por ISO2)
+NOMBRES_ISO2 = {p.iso2: p.nombre for p in PAISES.values()}
+
 # Todos los indicadores solicitados
 INDICADORES = {
-    "PIB": {"codigo": "NGDP_R", "unidad": "USD", "tipo": "bar"},
-    "PIB_per_capita": {"codigo": "NGDPDPC", "unidad": "USD", "tipo": "bar"},
-    "Inflación": {"codigo": "PCPI", "unidad": "%", "tipo": "line"},
-    "Exportaciones": {"codigo": "TXG_FOB_USD", "unidad": "USD", "tipo": "bar"},
-    "Importaciones": {"codigo": "TMG_CIF_USD", "unidad": "USD", "tipo": "bar"},
-    "Cuenta_Corriente": {"codigo": "BCA", "unidad": "% PIB", "tipo": "line"},
-    "Reservas": {"codigo": "RAXG", "unidad": "USD", "tipo": "bar"},
-    "Tasa_Interés": {"codigo": "FPOLM_PA", "unidad": "%", "tipo": "line"},
-    "Deuda_Pública": {"codigo": "GGXWDG", "unidad": "% PIB", "tipo": "bar"},
-    "Déficit_Fiscal": {"codigo": "GGXONLB", "unidad": "% PIB", "tipo": "bar"},
-    "Gasto_Público": {"codigo": "GGX", "unidad": "% PIB", "tipo": "bar"},
-    "Desempleo": {"codigo": "LUR", "unidad": "%", "tipo": "bar"},
-    "IED": {"codigo": "FDI", "unidad": "USD", "tipo": "bar"}
+    "PIB": Indicador("NGDP_R", "USD", "bar"),
+    "PIB_per_capita": Indicador("NGDPDPC", "USD", "bar"),
+    "Inflación": Indicador("PCPI", "%", "line"),
+    "Exportaciones": Indicador("TXG_FOB_USD", "USD", "bar"),
+    "Importaciones": Indicador("TMG_CIF_USD", "USD", "bar"),
+    "Cuenta_Corriente": Indicador("BCA", "% PIB", "line"),
+    "Reservas": Indicador("RAXG", "USD", "bar"),
+    "Tasa_Interés": Indicador("FPOLM_PA", "%", "line"),
+    "Deuda_Pública": Indicador("GGXWDG", "% PIB", "bar"),
+    "Déficit_Fiscal": Indicador("GGXONLB", "% PIB", "bar"),
+    "Gasto_Público": Indicador("GGX", "% PIB", "bar"),
+    "Desempleo": Indicador("LUR", "%", "bar"),
+    "IED": Indicador("FDI", "USD", "bar")
 }
 
+# Orden de los gráficos: (encabezado, indicador, título). La balanza comercial
+# combina Exportaciones e Importaciones y se dibuja aparte (indicador None)
+SECCIONES = [
+    ("📈 1. Producto Interno Bruto (PIB)", "PIB", "Evolución del PIB"),
+    ("📊 2. PIB per cápita", "PIB_per_capita", "PIB per cápita"),
+    ("📉 3. Inflación Anual", "Inflación", "Tasa de Inflación"),
+    ("🔄 4. Balanza Comercial (Último Año)", None, None),
+    ("💳 5. Cuenta Corriente (% PIB)", "Cuenta_Corriente", "Cuenta Corriente"),
+    ("💰 6. Reservas Internacionales", "Reservas", "Reservas Internacionales"),
+    ("📊 7. Tasas de Interés de Política Monetaria", "Tasa_Interés", "Tasas de Interés"),
+    ("🏛️ 8. Deuda Pública (% PIB)", "Deuda_Pública", "Deuda Pública"),
+    ("📉 9. Déficit Fiscal (% PIB)", "Déficit_Fiscal", "Déficit Fiscal"),
+    ("🏦 10. Gasto Público (% PIB)", "Gasto_Público", "Gasto Público"),
+    ("🧑‍💼 11. Tasa de Desempleo (%)", "Desempleo", "Tasa de Desempleo"),
+    ("🌐 12. Inversión Extranjera Directa (USD)", "IED", "Inversión Extranjera Directa")
+]
+
+INDICADORES_BALANZA = ["Exportaciones", "Importaciones"]
+
+# Barras máximas por gráfico de barras (por encima se agrupan años consecutivos)
+MAX_BARRAS = 200
+
+# Selección inicial de la barra lateral
+PAISES_DEFAULT = ["MEX", "USA", "BRA"]
+AÑOS_DEFAULT = (2010, 2023)
+
+# Sesión HTTP compartida: reutiliza conexiones (keep-alive) entre todas las llamadas al FMI.
+# Las respuestas se guardan además en disco (SQLite, 24 h) para sobrevivir a reinicios de la app;
+# @st.cache_data sigue actuando como caché en memoria por delante.
+# Streamlit reejecuta el script en cada interacción: la sesión (su pool de conexiones y la
+# base SQLite) se crea una sola vez por proceso y se comparte entre reruns y usuarios
+@st.cache_resource(show_spinner=False)
+def obtener_sesion():
+    # Ruta fija junto a app.py: el mismo fichero aunque se lance desde otro directorio
+    ruta_cache = os.path.join(os.path.dirname(os.path.abspath(__file__)), "imf_cache")
+    sesion = requests_cache.CachedSession(ruta_cache, backend="sqlite", expire_after=86400)
+    sesion.mount("https://", HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        # Reintentos con backoff exponencial; 429 respeta la cabecera Retry-After del FMI
+        max_retries=Retry(total=5, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504))
+    ))
+    return sesion
+
 # ======================================
 # 2. Funciones principales
 # ======================================
 
-@st.cache_data(ttl=3600)
-def obtener_datos_fmi(pais_iso2, indicador_codigo, start_year=2010, end_year=2023):
-    try:
-        url = f"https://www.imf.org/external/datamapper/api/v1/{indicador_codigo}/{pais_iso2}?periods={start_year}-{end_year}"
-        response = requests.get(url)
-        response.raise_for_status()
-        
-        data = response.json()
-        series = data["values"][indicador_codigo][pais_iso2]
-        
-        df = pd.DataFrame.from_dict(series, orient="index", columns=["Valor"])
-        df.index = df.index.astype(int)
-        df = df.reset_index().rename(columns={"index": "Año"})
-        df["Valor"] = pd.to_numeric(df["Valor"], errors="coerce")
-        
-        time.sleep(0.5)
-        return df.dropna()
+# Se ejecuta en hilos del pool: no escribe en la página (sin spinner ni st.error); los
+# errores se propagan como excepción al hilo principal (y st.cache_data no los guarda)
+@st.cache_data(ttl=3600, show_spinner=False)
+def obtener_datos_fmi_multi(iso2_list, indicador_codigo, start_year=2010, end_year=2023):
+    if not iso2_list:
+        return pd.DataFrame(columns=["Año", "Valor", "País"])
+    # Una sola petición por indicador con todos los países en la ruta
+    url = f"https://www.imf.org/external/datamapper/api/v1/{indicador_codigo}/{'/'.join(iso2_list)}?periods={start_year}-{end_year}"
+    response = obtener_sesion().get(url, timeout=10)
+    response.raise_for_status()
     
-    except Exception as e:
-        st.error(f"Error al obtener datos: {str(e)}")
-        return pd.DataFrame()
-
-def crear_grafico_comparativo(df, titulo, tipo, unidad, show_table=True):
-    if df.empty:
-        st.warning(f"No hay datos disponibles para {titulo}")
-        return
+    data = orjson.loads(response.content)
+    valores = data["values"][indicador_codigo]
+    
+    # Todas las series {año: valor} se vuelcan a arrays numpy contiguos en una sola
+    # pasada; los None del FMI pasan a NaN y se filtran con una única máscara
+    series = [(NOMBRES_ISO2[iso2], valores[iso2]) for iso2 in iso2_list if valores.get(iso2)]
+    if not series:
+        return pd.DataFrame(columns=["Año", "Valor", "País"])
+    
+    longitudes = [len(serie) for _, serie in series]
+    total = sum(longitudes)
+    años = np.fromiter((año for _, serie in series for año in serie), dtype=np.int32, count=total)
+    vals = np.fromiter((np.nan if v is None else v for _, serie in series for v in serie.values()),
+                       dtype=np.float64, count=total)
+    paises = np.repeat(np.array([nombre for nombre, _ in series], dtype=object), longitudes)
+    
+    mask = ~np.isnan(vals)
+    return pd.DataFrame({"Año": años[mask], "Valor": vals[mask], "País": paises[mask]})
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fecha_actual():
+    # Una sola lectura del reloj por hora para el slider y el pie de página
+    return datetime.now()
+
+def construir_peticiones(iso2_list, start_year, end_year):
+    # Una petición por indicador; la balanza comercial solo necesita el último año del rango
+    peticiones = {
+        indicador: (iso2_list, INDICADORES[indicador].codigo, start_year, end_year)
+        for _, indicador, _ in SECCIONES if indicador
+    }
+    peticiones.update({
+        indicador: (iso2_list, INDICADORES[indicador].codigo, end_year, end_year)
+        for indicador in INDICADORES_BALANZA
+    })
+    return peticiones
+
+def obtener_datos_paralelo(peticiones):
+    # Las llamadas al FMI son I/O de red: se lanza un indicador por hilo y se devuelve
+    # cada resultado (indicador, df, error) en cuanto llega, sin esperar al resto
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        futuros = {ex.submit(obtener_datos_fmi_multi, *args): indicador for indicador, args in peticiones.items()}
+        for futuro in as_completed(futuros):
+            error = futuro.exception()
+            df = pd.DataFrame(columns=["Año", "Valor", "País"]) if error else futuro.result()
+            yield futuros[futuro], df, error
+
+def agrupar_años(df, max_barras):
+    # Agrupa años consecutivos en bloques hasta caber en max_barras; se promedia porque
+    # sumar niveles o stocks (PIB, reservas) no tiene sentido. Cada bloque se etiqueta con
+    # el rango real de años que cubre ("2010–2012"; el último puede ser más corto)
+    años_por_grupo = -(-len(df) // max_barras)
+    inicio = df["Año"].min()
+    grupo = (inicio + (df["Año"] - inicio) // años_por_grupo * años_por_grupo).rename("Grupo")
+    fin = df["Año"].groupby(grupo).transform("max")
+    etiqueta = grupo.astype(str).where(grupo == fin, grupo.astype(str) + "–" + fin.astype(str)).rename("Año")
+    agrupado = df.groupby([grupo, etiqueta, "País"])["Valor"].mean().reset_index()
+    return agrupado[["Año", "Valor", "País"]], años_por_grupo
+
+@st.cache_data
+def pivotar_datos(df):
+    return df.pivot(index="Año", columns="País", values="Valor")
+
+# La figura se memoiza por contenido del DataFrame (huella en df_hash; _df no se
+# hashea) para no reconstruir las trazas de Plotly Express en cada rerun. La caché es
+# compartida por todas las sesiones: se acota en tamaño y caduca con los datos
+@st.cache_resource(max_entries=200, ttl=3600)
+def construir_figura(df_hash, _df, titulo, tipo, unidad):
+    # Importación diferida: plotly.express es caro de cargar y no hace falta hasta el primer gráfico
+    import plotly.express as px
+    
+    # Menos dígitos = menos JSON hacia el navegador; 4 decimales sobran para estos indicadores
+    _df = _df.assign(Valor=np.round(_df["Valor"].to_numpy(), 4))
     
     if tipo == "line":
-        fig = px.line(df, x="Año", y="Valor", color="País", 
-                     title=f"{titulo} ({unidad})", markers=True)
+        # Trazas WebGL (scattergl) en lugar de SVG para rangos de años largos
+        fig = px.line(_df, x="Año", y="Valor", color="País", 
+                     title=f"{titulo} ({unidad})", markers=True, render_mode="webgl")
     else:
-        fig = px.bar(df, x="Año", y="Valor", color="País", 
-                    title=f"{titulo} ({unidad})", barmode="group")
+        # Con años agrupados ("2010–2012") el eje es categórico y Plotly ordenaría las
+        # categorías por aparición; agrupar_años ya las devuelve en orden cronológico
+        orden = {"Año": list(_df["Año"].unique())} if _df["Año"].dtype == object else None
+        fig = px.bar(_df, x="Año", y="Valor", color="País", 
+                    title=f"{titulo} ({unidad})", barmode="group", category_orders=orden)
     
     fig.update_layout(
         hovermode="x unified",
         xaxis_title="Año",
         yaxis_title=unidad,
-        legend_title="País"
+        legend_title="País",
+        # Conserva zoom/leyenda entre reruns mientras los datos no cambien; con otros
+        # países o años la huella cambia y Plotly reinicia los ejes
+        uirevision=f"{titulo}-{df_hash}"
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+# Fragmento: interactuar con los widgets del gráfico (p. ej. la tabla) solo reejecuta
+# este bloque, no el script completo con las 12 secciones
+@st.fragment
+def crear_grafico_comparativo(df, titulo, tipo, unidad, show_table=True):
+    if df.empty:
+        st.warning(f"No hay datos disponibles para {titulo}")
+        return
+    
+    df_grafico, titulo_grafico = df, titulo
+    if tipo == "bar" and len(df) > MAX_BARRAS:
+        df_grafico, años_por_grupo = agrupar_años(df, MAX_BARRAS)
+        titulo_grafico = f"{titulo}, promedio de {años_por_grupo} años"
+    
+    df_hash = hash(pd.util.hash_pandas_object(df_grafico, index=False).values.tobytes())
+    fig = construir_figura(df_hash, df_grafico, titulo_grafico, tipo, unidad)
+    st.plotly_chart(fig, use_container_width=True, config={"responsive": True})
     
     if show_table:
         with st.expander("Ver datos tabulares"):
-            st.dataframe(df.pivot(index="Año", columns="País", values="Valor"))
+            # El contenido del expander se ejecuta aunque esté cerrado: la tabla
+            # solo se calcula cuando el usuario la pide
+            if st.toggle("Mostrar tabla", key=f"tabla_{titulo}"):
+                st.dataframe(pivotar_datos(df))
+
+def crear_grafico_balanza(df_export, df_import, año):
+    import plotly.express as px
+    
+    df_export = df_export[["País", "Valor"]].rename(columns={"Valor": "Exportaciones"})
+    df_import = df_import[["País", "Valor"]].rename(columns={"Valor": "Importaciones"})
+    datos_balanza = df_export.merge(df_import, on="País")
+    
+    if not datos_balanza.empty:
+        fig = px.bar(datos_balanza.melt(id_vars="País", var_name="Tipo", value_name="Valor"), 
+                     x="País", y="Valor", color="Tipo", barmode="group",
+                     title=f"Balanza Comercial ({año})")
+        st.plotly_chart(fig, use_container_width=True)
 
 # ======================================
 # 3. Interfaz de Usuario
 # ======================================
 
 st.title("🌍 Análisis Económico Completo (Datos FMI)")
+hoy = fecha_actual()
 
 # Sidebar
 with st.sidebar:
@@ -111,176 +270,51 @@ with st.sidebar:
     paises_seleccionados = st.multiselect(
         "Seleccionar países:",
         options=list(PAISES.keys()),
-        format_func=lambda x: PAISES[x]["nombre"],
-        default=["MEX", "USA", "BRA"]
+        format_func=lambda x: PAISES[x].nombre,
+        default=PAISES_DEFAULT
     )
     
     año_inicio, año_fin = st.slider(
         "Rango de años:",
         min_value=1990,
-        max_value=datetime.now().year,
-        value=(2010, 2023)
+        max_value=hoy.year,
+        value=AÑOS_DEFAULT
     )
 
 # ======================================
 # 4. Visualización de Todos los Gráficos
 # ======================================
 
-# Gráfico 1: PIB
-st.header("📈 1. Producto Interno Bruto (PIB)")
-datos_pib = []
-for pais in paises_seleccionados:
-    df = obtener_datos_fmi(PAISES[pais]["iso2"], "NGDP_R", año_inicio, año_fin)
-    if not df.empty:
-        df["País"] = PAISES[pais]["nombre"]
-        datos_pib.append(df)
-
-if datos_pib:
-    crear_grafico_comparativo(pd.concat(datos_pib), "Evolución del PIB", "bar", "USD")
-
-# Gráfico 2: PIB per cápita
-st.header("📊 2. PIB per cápita")
-datos_pib_per_capita = []
-for pais in paises_seleccionados:
-    df = obtener_datos_fmi(PAISES[pais]["iso2"], "NGDPDPC", año_inicio, año_fin)
-    if not df.empty:
-        df["País"] = PAISES[pais]["nombre"]
-        datos_pib_per_capita.append(df)
-
-if datos_pib_per_capita:
-    crear_grafico_comparativo(pd.concat(datos_pib_per_capita), "PIB per cápita", "bar", "USD")
-
-# Gráfico 3: Inflación
-st.header("📉 3. Inflación Anual")
-datos_inflacion = []
-for pais in paises_seleccionados:
-    df = obtener_datos_fmi(PAISES[pais]["iso2"], "PCPI", año_inicio, año_fin)
-    if not df.empty:
-        df["País"] = PAISES[pais]["nombre"]
-        datos_inflacion.append(df)
-
-if datos_inflacion:
-    crear_grafico_comparativo(pd.concat(datos_inflacion), "Tasa de Inflación", "line", "%")
-
-# Gráfico 4: Balanza Comercial (Último año disponible)
-st.header("🔄 4. Balanza Comercial (Último Año)")
-if paises_seleccionados:
-    año_actual = año_fin
-    datos_balanza = []
-    
-    for pais in paises_seleccionados:
-        df_export = obtener_datos_fmi(PAISES[pais]["iso2"], "TXG_FOB_USD", año_actual, año_actual)
-        df_import = obtener_datos_fmi(PAISES[pais]["iso2"], "TMG_CIF_USD", año_actual, año_actual)
+# Encabezados primero, con un hueco por sección que se rellena al llegar sus datos
+marcadores = {}
+for encabezado, indicador, titulo in SECCIONES:
+    st.header(encabezado)
+    marcadores[indicador] = st.empty()
+titulos = {indicador: titulo for _, indicador, titulo in SECCIONES}
+
+# Descarga concurrente: cada gráfico se dibuja en cuanto termina su petición
+isos = [PAISES[pais].iso2 for pais in paises_seleccionados]
+datos_balanza, errores_balanza = {}, []
+with st.spinner("Descargando datos del FMI..."):
+    for indicador, df, error in obtener_datos_paralelo(construir_peticiones(isos, año_inicio, año_fin)):
+        if indicador in INDICADORES_BALANZA:
+            # Balanza Comercial (último año del rango): necesita ambas series
+            datos_balanza[indicador] = df
+            if error is not None:
+                errores_balanza.append(error)
+            if len(datos_balanza) == len(INDICADORES_BALANZA) and paises_seleccionados:
+                with marcadores[None].container():
+                    for e in errores_balanza:
+                        st.error(f"Error al obtener datos: {str(e)}")
+                    crear_grafico_balanza(*(datos_balanza[i] for i in INDICADORES_BALANZA), año_fin)
+            continue
         
-        if not df_export.empty and not df_import.empty:
-            datos_balanza.append({
-                "País": PAISES[pais]["nombre"],
-                "Exportaciones": df_export["Valor"].values[0],
-                "Importaciones": df_import["Valor"].values[0]
-            })
-    
-    if datos_balanza:
-        df_balanza = pd.DataFrame(datos_balanza)
-        fig = px.bar(df_balanza.melt(id_vars="País", var_name="Tipo", value_name="Valor"), 
-                     x="País", y="Valor", color="Tipo", barmode="group",
-                     title=f"Balanza Comercial ({año_actual})")
-        st.plotly_chart(fig, use_container_width=True)
-
-# Gráfico 5: Cuenta Corriente
-st.header("💳 5. Cuenta Corriente (% PIB)")
-datos_cuenta = []
-for pais in paises_seleccionados:
-    df = obtener_datos_fmi(PAISES[pais]["iso2"], "BCA", año_inicio, año_fin)
-    if not df.empty:
-        df["País"] = PAISES[pais]["nombre"]
-        datos_cuenta.append(df)
-
-if datos_cuenta:
-    crear_grafico_comparativo(pd.concat(datos_cuenta), "Cuenta Corriente", "line", "% PIB")
-
-# Gráfico 6: Reservas Internacionales
-st.header("💰 6. Reservas Internacionales")
-datos_reservas = []
-for pais in paises_seleccionados:
-    df = obtener_datos_fmi(PAISES[pais]["iso2"], "RAXG", año_inicio, año_fin)
-    if not df.empty:
-        df["País"] = PAISES[pais]["nombre"]
-        datos_reservas.append(df)
-
-if datos_reservas:
-    crear_grafico_comparativo(pd.concat(datos_reservas), "Reservas Internacionales", "bar", "USD")
-
-# Gráfico 7: Tasas de Interés
-st.header("📊 7. Tasas de Interés de Política Monetaria")
-datos_tasas = []
-for pais in paises_seleccionados:
-    df = obtener_datos_fmi(PAISES[pais]["iso2"], "FPOLM_PA", año_inicio, año_fin)
-    if not df.empty:
-        df["País"] = PAISES[pais]["nombre"]
-        datos_tasas.append(df)
-
-if datos_tasas:
-    crear_grafico_comparativo(pd.concat(datos_tasas), "Tasas de Interés", "line", "%")
-
-# Gráfico 8: Deuda Pública
-st.header("🏛️ 8. Deuda Pública (% PIB)")
-datos_deuda = []
-for pais in paises_seleccionados:
-    df = obtener_datos_fmi(PAISES[pais]["iso2"], "GGXWDG", año_inicio, año_fin)
-    if not df.empty:
-        df["País"] = PAISES[pais]["nombre"]
-        datos_deuda.append(df)
-
-if datos_deuda:
-    crear_grafico_comparativo(pd.concat(datos_deuda), "Deuda Pública", "bar", "% PIB")
-
-# Gráfico 9: Déficit Fiscal
-st.header("📉 9. Déficit Fiscal (% PIB)")
-datos_deficit = []
-for pais in paises_seleccionados:
-    df = obtener_datos_fmi(PAISES[pais]["iso2"], "GGXONLB", año_inicio, año_fin)
-    if not df.empty:
-        df["País"] = PAISES[pais]["nombre"]
-        datos_deficit.append(df)
-
-if datos_deficit:
-    crear_grafico_comparativo(pd.concat(datos_deficit), "Déficit Fiscal", "bar", "% PIB")
-
-# Gráfico 10: Gasto Público
-st.header("🏦 10. Gasto Público (% PIB)")
-datos_gasto = []
-for pais in paises_seleccionados:
-    df = obtener_datos_fmi(PAISES[pais]["iso2"], "GGX", año_inicio, año_fin)
-    if not df.empty:
-        df["País"] = PAISES[pais]["nombre"]
-        datos_gasto.append(df)
-
-if datos_gasto:
-    crear_grafico_comparativo(pd.concat(datos_gasto), "Gasto Público", "bar", "% PIB")
-
-# Gráfico 11: Desempleo
-st.header("🧑‍💼 11. Tasa de Desempleo (%)")
-datos_desempleo = []
-for pais in paises_seleccionados:
-    df = obtener_datos_fmi(PAISES[pais]["iso2"], "LUR", año_inicio, año_fin)
-    if not df.empty:
-        df["País"] = PAISES[pais]["nombre"]
-        datos_desempleo.append(df)
-
-if datos_desempleo:
-    crear_grafico_comparativo(pd.concat(datos_desempleo), "Tasa de Desempleo", "bar", "%")
-
-# Gráfico 12: Inversión Extranjera Directa
-st.header("🌐 12. Inversión Extranjera Directa (USD)")
-datos_ied = []
-for pais in paises_seleccionados:
-    df = obtener_datos_fmi(PAISES[pais]["iso2"], "FDI", año_inicio, año_fin)
-    if not df.empty:
-        df["País"] = PAISES[pais]["nombre"]
-        datos_ied.append(df)
-
-if datos_ied:
-    crear_grafico_comparativo(pd.concat(datos_ied), "Inversión Extranjera Directa", "bar", "USD")
+        if error is not None:
+            marcadores[indicador].error(f"Error al obtener datos: {str(error)}")
+        elif not df.empty:
+            meta = INDICADORES[indicador]
+            with marcadores[indicador].container():
+                crear_grafico_comparativo(df, titulos[indicador], meta.tipo, meta.unidad)
 
 # ======================================
 # 5. Pie de Página
@@ -290,4 +324,4 @@ st.info("""
 **Fuente de datos:** [Fondo Monetario Internacional (FMI)](https://www.imf.org)  
 **Última actualización:** {date}  
 **Nota:** Los datos pueden tener rezagos de hasta 6 meses dependiendo del indicador
-""".format(date=datetime.now().strftime("%Y-%m-%d")))
+""".format(date=hoy.strftime("%Y-%m-%d")))